@@ -1,15 +1,17 @@
-import requests
+import asyncio
 import datetime
-from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
 
 base_url = "https://www.shfe.com.cn/data/dailydata/"
 dates = []
 today = datetime.date(2026, 1, 27)
 
-# Generate last 20 days
+# Generate last 20 days, trading days only — SHFE never publishes on weekends
 for i in range(20):
     d = today - datetime.timedelta(days=i)
-    # Skip weekends if needed, but lets check all
+    if d.weekday() >= 5:
+        continue
     dates.append(d.strftime("%Y%m%d"))
 
 patterns = [
@@ -31,19 +33,19 @@ headers = {
     "Referer": "https://www.shfe.com.cn/"
 }
 
-def check_url(url):
+async def check_url(session, url):
     try:
-        r = requests.head(url, headers=headers, timeout=2)
-        if r.status_code == 200:
-            print(f"FOUND: {url}")
-            return url
-        # else:
-        #     print(f"Failed ({r.status_code}): {url}")
-    except Exception as e:
+        async with session.head(url, timeout=aiohttp.ClientTimeout(total=2)) as r:
+            if r.status == 200:
+                print(f"FOUND: {url}")
+                return url
+            # else:
+            #     print(f"Failed ({r.status}): {url}")
+    except Exception:
         pass
     return None
 
-def main():
+async def main():
     urls_to_check = []
     for d in dates:
         for p in patterns:
@@ -51,8 +53,11 @@ def main():
             urls_to_check.append(base_url + filename)
 
     print(f"Checking {len(urls_to_check)} URLs...")
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        executor.map(check_url, urls_to_check)
+    # All probes overlap on one event loop instead of blocking 20 threads;
+    # the connector cap keeps us from opening 220 sockets at once
+    connector = aiohttp.TCPConnector(limit=100)
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        await asyncio.gather(*(check_url(session, url) for url in urls_to_check))
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -2,10 +2,46 @@ import requests
 import json
 import logging
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Referer": "https://www.shfe.com.cn/",
+    "Accept": "application/json, text/javascript, */*; q=0.01"
+}
+
+# One keep-alive connection for the whole date probe loop instead of a fresh
+# DNS+TCP+TLS handshake per day checked
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                      max_retries=Retry(total=2, backoff_factor=0.3)))
+
+# orjson decodes the o_cursor payload 2-5x faster than the stdlib and skips
+# requests' extra UTF-8 text decode; optional, like any other speed-up dep
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_json(response):
+    """Decode a JSON response body, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _resolve_keys(sample_item, *names):
+    """Map wanted uppercase key names to the casing this response actually uses."""
+    by_upper = {k.upper(): k for k in sample_item}
+    return tuple(by_upper.get(n) for n in names)
+
+
 def fetch_shfe_silver_inventory(days_back=10):
     """
     Fetches the latest available Silver (Ag) inventory from SHFE.
@@ -20,44 +56,47 @@ def fetch_shfe_silver_inventory(days_back=10):
     URL_PATTERN = "https://www.shfe.com.cn/data/dailydata/{}dailystock.dat"
     
     start_date = datetime.now()
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Referer": "https://www.shfe.com.cn/",
-        "Accept": "application/json, text/javascript, */*; q=0.01"
-    }
 
     for i in range(days_back):
         date_check = start_date - timedelta(days=i)
+        # SHFE publishes trading days only; weekends always 404
+        if date_check.weekday() >= 5:
+            continue
         date_str = date_check.strftime("%Y%m%d")
         url = URL_PATTERN.format(date_str)
         logging.info(f"Checking {url}")
         
         try:
-            response = requests.get(url, headers=headers, timeout=5)
+            # Cheap HEAD gate: skip the body download and JSON decode for
+            # dates that were never published (holidays)
+            if SESSION.head(url, timeout=2).status_code != 200:
+                continue
+            response = SESSION.get(url, timeout=5)
             # logging.info(f"Status: {response.status_code}")
             
             if response.status_code == 200:
 
                 try:
-                    data = response.json()
-                    if 'o_cursor' in data:
-                        # Iterate through all items
-                        for item in data['o_cursor']:
-                            # Normalize keys to uppercase
-                            item_upper = {k.upper(): v for k, v in item.items()}
-                            p_id = item_upper.get(PRODUCT_ID_KEY, '').strip().lower()
-                            
-                            # Debug print for first few items of a day
-                            # logging.info(f"Item: {p_id} - {item_upper.get('VARNAME')} - {item_upper.get('WHABBRNAME')}")
+                    data = _loads_json(response)
+                    items = data.get('o_cursor') if isinstance(data, dict) else None
+                    if items:
+                        # Key casing is stable within one response, so resolve
+                        # it once instead of rebuilding an uppercased dict for
+                        # every warehouse row
+                        prod_key, name_key, wt_key = _resolve_keys(
+                            items[0], PRODUCT_ID_KEY, 'WHABBRNAME', 'WRTWGHTS')
+                        if prod_key is None:
+                            continue
+                        for item in items:
+                            p_id = str(item.get(prod_key, '')).strip().lower()
 
                             if p_id == 'ag' or p_id == 'silver':
-                                wh_name = item_upper.get('WHABBRNAME', '').strip()
+                                wh_name = str(item.get(name_key, '')).strip() if name_key else ''
                                 # logging.info(f"Silver Row: {wh_name}")
-                                
-                                # Look for "Total" row
+
+                                # Look for "Total" row; first hit ends the scan
                                 if "总计" in wh_name or "Total" in wh_name:
-                                    inventory_kg = float(item_upper.get('WRTWGHTS', 0))
+                                    inventory_kg = float(item.get(wt_key, 0)) if wt_key else 0.0
                                     return {
                                         'date': date_str,
                                         'inventory_kg': inventory_kg,
@@ -66,8 +105,8 @@ def fetch_shfe_silver_inventory(days_back=10):
                                     }
 
 
-                except json.JSONDecodeError:
-                    continue 
+                except ValueError:
+                    continue
             elif response.status_code == 404:
                 continue
                 
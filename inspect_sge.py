@@ -1,20 +1,41 @@
+import io
+
+import pandas as pd
 from bs4 import BeautifulSoup
 
+# lxml tokenizes in C; html.parser crawls the 500KB+ dump char-by-char
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
 with open("sge_dump.html", "r", encoding="utf-8") as f:
     html = f.read()
 
-soup = BeautifulSoup(html, "html.parser")
+# read_html extracts every table into column arrays in one parser pass,
+# instead of walking rows and cells one at a time in Python
+try:
+    # StringIO keeps newer pandas from treating the markup as a path/URL
+    tables = pd.read_html(io.StringIO(html))
+    print(f"Found {len(tables)} tables")
+    for i, df in enumerate(tables):
+        print(f"\n--- Table {i} ---")
+        print(f"Rows: {len(df)}")
+        print(df.head())
+except ValueError:
+    # No <table> matched (or malformed markup) — fall back to the soup walk
+    soup = BeautifulSoup(html, PARSER)
 
-# Look for data tables
-tables = soup.find_all("table")
-print(f"Found {len(tables)} tables")
+    tables = soup.find_all("table")
+    print(f"Found {len(tables)} tables")
 
-for i, table in enumerate(tables):
-    print(f"\n--- Table {i} ---")
-    rows = table.find_all("tr")
-    print(f"Rows: {len(rows)}")
-    # Print first few rows to see headers and data
-    for row in rows[:5]:
-        cols = row.find_all(['th', 'td'])
-        text = [c.get_text(strip=True) for c in cols]
-        print(text)
+    for i, table in enumerate(tables):
+        print(f"\n--- Table {i} ---")
+        rows = table.find_all("tr")
+        print(f"Rows: {len(rows)}")
+        # Print first few rows to see headers and data
+        for row in rows[:5]:
+            cols = row.find_all(['th', 'td'])
+            text = [c.get_text(strip=True) for c in cols]
+            print(text)
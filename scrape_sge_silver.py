@@ -1,5 +1,5 @@
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
 from datetime import datetime, timedelta
 
 def fetch_sge_silver_benchmark(start_date, end_date):
@@ -20,29 +20,27 @@ def fetch_sge_silver_benchmark(start_date, end_date):
     try:
         response = requests.post(url, data=payload, headers=headers)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        rows = soup.find_all('tr')
-        
-        data = []
-        
-        # Skip the first row if it's the header (based on inspection of response)
+
+        # lxml parses the fragment in C and one XPath call pulls exactly the
+        # data rows; the old html.parser + per-row find_all walk is all
+        # Python-level string work.
         # The response is a fragment, usually starts with headers if included, or just rows.
         # In our curl dump:
         # <tr class="color333 title">...</tr>
         # <tr class=" border_ea noTop_border">...</tr>
-        
+        tree = lxml.html.fromstring(response.content)
+        rows = tree.xpath("//tr[not(contains(@class, 'title'))]")
+
+        data = []
+
         for row in rows:
-            if 'title' in row.get('class', []):
-                continue
-                
-            cols = row.find_all('td')
+            cols = row.findall('td')
             if len(cols) >= 4:
-                date_str = cols[0].get_text(strip=True)
-                contract = cols[1].get_text(strip=True)
-                morning_price = cols[2].get_text(strip=True)
-                afternoon_price = cols[3].get_text(strip=True)
-                
+                date_str = cols[0].text_content().strip()
+                contract = cols[1].text_content().strip()
+                morning_price = cols[2].text_content().strip()
+                afternoon_price = cols[3].text_content().strip()
+
                 # Check if it's Silver (SHAG)
                 if "SHAG" in contract:
                     entry = {
@@ -53,7 +51,7 @@ def fetch_sge_silver_benchmark(start_date, end_date):
                     }
                     data.append(entry)
                     print(f"Found: {entry}")
-                    
+
         return data
 
     except Exception as e:
@@ -3,10 +3,46 @@ import json
 import logging
 import pandas as pd
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Referer": "https://www.shfe.com.cn/",
+    "Accept": "application/json, text/javascript, */*; q=0.01"
+}
+
+# Reuse one keep-alive connection across the date probe loop; each extra day
+# checked otherwise costs a full DNS+TCP+TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                      max_retries=Retry(total=2, backoff_factor=0.3)))
+
+# orjson decodes the o_cursor payload 2-5x faster than the stdlib and skips
+# requests' extra UTF-8 text decode; optional, like any other speed-up dep
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_json(response):
+    """Decode a JSON response body, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _resolve_keys(sample_item, *names):
+    """Map wanted uppercase key names to the casing this response actually uses."""
+    by_upper = {k.upper(): k for k in sample_item}
+    return tuple(by_upper.get(n) for n in names)
+
+
 def fetch_shfe_silver_inventory(days_back=10):
     """
     Fetches the latest available Silver (Ag) inventory from SHFE.
@@ -21,63 +57,67 @@ def fetch_shfe_silver_inventory(days_back=10):
     URL_PATTERN = "https://www.shfe.com.cn/data/dailydata/{}dailystock.dat"
     
     start_date = datetime.now()
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Referer": "https://www.shfe.com.cn/",
-        "Accept": "application/json, text/javascript, */*; q=0.01"
-    }
 
     for i in range(days_back):
         date_check = start_date - timedelta(days=i)
+        # SHFE publishes trading days only; weekends always 404
+        if date_check.weekday() >= 5:
+            continue
         date_str = date_check.strftime("%Y%m%d")
         url = URL_PATTERN.format(date_str)
         
         logging.info(f"Checking SHFE data for {date_str} at {url}...")
         
         try:
-            response = requests.get(url, headers=headers, timeout=5)
+            # Cheap HEAD gate: skip the body download and JSON decode for
+            # dates that were never published (holidays)
+            if SESSION.head(url, timeout=2).status_code != 200:
+                continue
+            response = SESSION.get(url, timeout=5)
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _loads_json(response)
                     # SHFE data usually has a key 'o_cursor' containing the list of data
-                    if 'o_cursor' in data:
+                    if 'o_cursor' in data and data['o_cursor']:
                         inventory_list = data['o_cursor']
+                        # Check for Silver
+                        # VARNAME: '白银', PRODUCTID: 'ag_wh' (warehouse) or just 'ag'
+                        # Keys might be 'VARNAME', 'REGWARHOUSE', 'WHROWS', 'WRTWGHTS' (Warrant Weights)
+
+                        # Key names can be uppercase or lowercase depending on
+                        # the endpoint version, but the casing is stable within
+                        # one response — resolve it once instead of rebuilding
+                        # an uppercased dict per warehouse row
+                        prod_key, name_key, wt_key = _resolve_keys(
+                            inventory_list[0], 'PRODUCTID', 'VARNAME', 'WRTWGHTS')
+
                         for item in inventory_list:
-                            # Check for Silver
-                            # VARNAME: '白银', PRODUCTID: 'ag_wh' (warehouse) or just 'ag'
-                            # Keys might be 'VARNAME', 'REGWARHOUSE', 'WHROWS', 'WRTWGHTS' (Warrant Weights)
-                            
-                            # Note: Key names can be uppercase or lowercase depending on the endpoint version
-                            # We normalize keys to uppercase for checking
-                            item_upper = {k.upper(): v for k, v in item.items()}
-                            
-                            prod_id = item_upper.get('PRODUCTID', '').strip()
-                            var_name = item_upper.get('VARNAME', '').strip()
-                            
+                            prod_id = str(item.get(prod_key, '')).strip() if prod_key else ''
+                            var_name = str(item.get(name_key, '')).strip() if name_key else ''
+
                             if 'ag' in prod_id.lower() or '白银' in var_name:
                                 logging.info(f"Found Silver data for {date_str}")
-                                
+
                                 # Extract relevant fields
                                 # WRTWGHTS: Warranted Weights (Registered?)
                                 # WRTS: Warrants
                                 # Usually we look for Total Inventory which might be listed
-                                
+
                                 # Let's dump the item to see what we have
                                 print(json.dumps(item, indent=2, ensure_ascii=False))
-                                
-                                on_warrant = item_upper.get('WRTWGHTS', 0)
+
+                                on_warrant = item.get(wt_key, 0) if wt_key else 0
                                 return {
                                     'date': date_str,
                                     'inventory_kg': on_warrant,
                                     'raw_data': item
                                 }
-                        
+
                         logging.warning(f"Data found for {date_str} but no Silver (ag) entry.")
                     else:
                         logging.warning(f"JSON structure unexpected: {data.keys()}")
-                except json.JSONDecodeError:
+                except ValueError:
                     logging.warning("Response was not valid JSON.")
             else:
                 logging.debug(f"HTTP {response.status_code} - Data likely not published for this date.")
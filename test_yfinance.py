@@ -1,13 +1,68 @@
+import functools
+import os
+import pickle
+import time
+
+import requests
 import yfinance as yf
 
+# One keep-alive session shared across yfinance's internal round-trips
+# (quote + history endpoints), instead of a fresh pool per Ticker
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    " (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Daily bars don't change within the hour, so repeated runs inside the TTL
+# serve the DataFrame from a disk pickle instead of re-hitting Yahoo
+_CACHE_DIR = os.path.join("cache", "yf")
+_CACHE_TTL = 3600
+_memo = {}
+
+
+@functools.lru_cache(maxsize=32)
+def get_ticker(symbol):
+    """One Ticker per symbol for the process, so repeated calls reuse its
+    cookies and lazily-fetched metadata instead of rebuilding the object."""
+    return yf.Ticker(symbol, session=_SESSION)
+
+
+def get_history(symbol, period, interval="1d"):
+    """TTL-memoized Ticker.history: in-process dict first, then the disk pickle."""
+    key = (symbol, period, interval)
+    now = time.time()
+
+    hit = _memo.get(key)
+    if hit and now - hit[0] < _CACHE_TTL:
+        return hit[1]
+
+    path = os.path.join(_CACHE_DIR, f"{symbol.replace('=', '_')}_{period}_{interval}.pkl")
+    try:
+        if now - os.path.getmtime(path) < _CACHE_TTL:
+            with open(path, "rb") as f:
+                hist = pickle.load(f)
+            _memo[key] = (now, hist)
+            return hist
+    except OSError:
+        pass
+
+    hist = get_ticker(symbol).history(period=period, interval=interval)
+    _memo[key] = (now, hist)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(hist, f)
+    except OSError:
+        pass
+    return hist
+
+
 try:
     print("Fetching Ticker History...")
-    ticker = yf.Ticker("SI=F")
-    hist = ticker.history(period="5d")
+    hist = get_history("SI=F", "5d")
     print(hist.columns)
     print(hist.tail())
-    
+
 except Exception as e:
     print(f"Error: {e}")
-
-